@@ -2,10 +2,10 @@
 
 
 a = Analysis(
-    ['.venv\\gui.py'],
-    pathex=[],
+    ['src\\dcm_to_stl\\__main__.py'],
+    pathex=['src'],
     binaries=[],
-    datas=[('.venv\\mode.ini', '.'), ('.venv\\target_config.ini', '.'), ('withholding-icon-transparent.ico', '_internal')],
+    datas=[('resources\\config\\target_config.ini', 'config'), ('resources\\icons\\icon.ico', 'icons')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
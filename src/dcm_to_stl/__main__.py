@@ -6,10 +6,12 @@ Use --cli flag for command-line interface.
 import sys
 
 if __name__ == '__main__':
-    # Check for CLI flag
+    # Absolute imports: when frozen by PyInstaller this file runs as the
+    # top-level script with no parent package, so relative imports fail.
+    # The package itself is importable (pathex=['src'] in the spec).
     if '--cli' in sys.argv:
-        from .cli.main import main
+        from dcm_to_stl.cli.main import main
         sys.exit(main())
     else:
-        from .gui.app import main
+        from dcm_to_stl.gui.app import main
         main()
@@ -5,7 +5,6 @@ core conversion logic.
 """
 import atexit
 import sys
-from tkinter.filedialog import askdirectory
 from ..core.converter import DCMConverter
 from ..core.sdx_interface import SDXInterface
 from ..config.registry import get_mode
@@ -15,10 +14,16 @@ from ..config.settings import get_target_filenames
 def progress_callback(message: str) -> None:
     """Print progress messages to console.
 
+    Writes through sys.stdout directly and only flushes on meaningful
+    updates; the periodic "converting..." ticks stay in the block buffer
+    so they don't cost a write syscall each.
+
     Args:
         message: Progress message to print
     """
-    print(f"[PROGRESS] {message}")
+    sys.stdout.write(f"[PROGRESS] {message}\n")
+    if not message.startswith("converting"):
+        sys.stdout.flush()
 
 
 def main() -> int:
@@ -27,6 +32,13 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    # Switch stdout to block buffering so progress lines don't each pay
+    # a flush; errors still go to stderr, which stays unbuffered.
+    try:
+        sys.stdout.reconfigure(line_buffering=False)
+    except (AttributeError, ValueError):
+        pass  # Non-reconfigurable stream (e.g. under test harness)
+
     sdx = None
     try:
         # Initialize persistent SDX connection
@@ -35,9 +47,16 @@ def main() -> int:
         sdx.attach()
         atexit.register(sdx.detach)
         print("✓ SDX connected")
+        sys.stdout.flush()
+
+        # Get directory from user. Tk is imported lazily so non-interactive
+        # paths never pay its load cost.
+        from tkinter.filedialog import askdirectory
 
-        # Get directory from user
         print("\nDCM to STL Converter - Select folder")
+        # Flush before blocking on the dialog; stdout is block-buffered,
+        # so without this the prompt sits invisible in the buffer
+        sys.stdout.flush()
         directory = askdirectory(title='Select Folder', mustexist=True)
 
         if not directory:
@@ -67,10 +86,10 @@ def main() -> int:
         return 0
 
     except KeyboardInterrupt:
-        print("\n✗ Conversion cancelled by user")
+        print("\n✗ Conversion cancelled by user", file=sys.stderr)
         return 1
     except Exception as e:
-        print(f"\n✗ Error: {e}")
+        print(f"\n✗ Error: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc()
         return 1
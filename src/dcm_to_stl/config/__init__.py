@@ -3,6 +3,7 @@ from .registry import (
     get_mode,
     set_mode,
     toggle_mode,
+    refresh_mode_cache,
     initialize_registry,
     RegistryConfigError
 )
@@ -19,6 +20,7 @@ __all__ = [
     'get_mode',
     'set_mode',
     'toggle_mode',
+    'refresh_mode_cache',
     'initialize_registry',
     'RegistryConfigError',
     'get_resource_path',
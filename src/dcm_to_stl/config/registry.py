@@ -2,44 +2,126 @@
 
 This module manages the conversion mode setting stored in Windows Registry.
 Registry path: HKEY_CURRENT_USER\\Software\\CreoDent Prosthetics
+
+The registry key handle is opened once and reused, and the mode value is
+cached in-process so repeated get_mode() calls (e.g. from the GUI) don't
+re-issue RegOpenKeyEx/RegQueryValueEx syscalls. The cache is updated on
+set_mode()/toggle_mode() rather than re-read from the registry.
 """
+import atexit
 import winreg
-from typing import Literal
+from typing import Literal, Optional
 
 
 REGISTRY_PATH = r'Software\CreoDent Prosthetics'
 MODE_KEY = 'mode'
 
+# Cached open key handles and mode value (lazily populated). Reads go
+# through a KEY_READ handle; the writable handle is only opened on the
+# first mode change, keeping the common path on the cheaper ACL check.
+_read_key: Optional[winreg.HKEYType] = None
+_write_key: Optional[winreg.HKEYType] = None
+_mode_cache: Optional[str] = None
+_atexit_registered = False
+
 
 class RegistryConfigError(Exception):
     """Exception raised for registry configuration errors."""
     pass
 
 
+def _close_keys() -> None:
+    """Close the cached registry key handles (registered with atexit)."""
+    global _read_key, _write_key
+    for key in (_read_key, _write_key):
+        if key is not None:
+            try:
+                winreg.CloseKey(key)
+            except OSError:
+                pass
+    _read_key = None
+    _write_key = None
+
+
+def _open_key(access: int) -> winreg.HKEYType:
+    """Open (creating if needed) the application registry key.
+
+    Args:
+        access: winreg access mask for the handle
+
+    Returns:
+        Open HKEY handle for the application registry key
+
+    Raises:
+        RegistryConfigError: If the key cannot be opened or created
+    """
+    try:
+        return winreg.CreateKeyEx(
+            winreg.HKEY_CURRENT_USER,
+            REGISTRY_PATH,
+            access=access
+        )
+    except Exception as e:
+        raise RegistryConfigError(f"Failed to open registry key: {e}")
+
+
+def _register_atexit() -> None:
+    """Register the handle cleanup hook once."""
+    global _atexit_registered
+    if not _atexit_registered:
+        atexit.register(_close_keys)
+        _atexit_registered = True
+
+
+def _get_read_key() -> winreg.HKEYType:
+    """Get the cached read-only key handle, opening it on first use."""
+    global _read_key
+    if _read_key is None:
+        _read_key = _open_key(winreg.KEY_READ)
+        _register_atexit()
+    return _read_key
+
+
+def _get_write_key() -> winreg.HKEYType:
+    """Get the cached writable key handle, opening it on first use."""
+    global _write_key
+    if _write_key is None:
+        _write_key = _open_key(winreg.KEY_READ | winreg.KEY_WRITE)
+        _register_atexit()
+    return _write_key
+
+
 def initialize_registry() -> None:
     """Create registry key if it doesn't exist, with default mode '0'.
 
     Raises:
         RegistryConfigError: If registry operations fail
     """
+    global _mode_cache
     try:
-        # Try to create the key (does nothing if already exists)
-        key = winreg.CreateKey(winreg.HKEY_CURRENT_USER, REGISTRY_PATH)
+        key = _get_write_key()
 
         # Check if mode value exists
         try:
-            winreg.QueryValueEx(key, MODE_KEY)
+            mode, _ = winreg.QueryValueEx(key, MODE_KEY)
         except FileNotFoundError:
             # Mode doesn't exist, create it with default value '0'
             winreg.SetValueEx(key, MODE_KEY, 0, winreg.REG_SZ, '0')
+            mode = '0'
 
-        winreg.CloseKey(key)
+        _mode_cache = mode
+    except RegistryConfigError:
+        raise
     except Exception as e:
         raise RegistryConfigError(f"Failed to initialize registry: {e}")
 
 
 def get_mode() -> Literal['0', '1']:
-    """Get the current conversion mode from registry.
+    """Get the current conversion mode.
+
+    Returns the in-process cached value when available; only the first
+    call (or the first call after a cache invalidation) touches the
+    registry.
 
     Returns:
         '0' for convert all DCM files, '1' for convert target files only
@@ -47,23 +129,26 @@ def get_mode() -> Literal['0', '1']:
     Raises:
         RegistryConfigError: If registry read fails or mode is invalid
     """
+    global _mode_cache
+    if _mode_cache is not None:
+        return _mode_cache
+
     try:
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            REGISTRY_PATH,
-            access=winreg.KEY_READ
-        )
-        mode, _ = winreg.QueryValueEx(key, MODE_KEY)
-        winreg.CloseKey(key)
+        key = _get_read_key()
+        try:
+            mode, _ = winreg.QueryValueEx(key, MODE_KEY)
+        except FileNotFoundError:
+            # Mode value doesn't exist yet, initialize it
+            initialize_registry()
+            return _mode_cache
 
         if mode not in ('0', '1'):
             raise RegistryConfigError(f"Invalid mode value in registry: {mode}")
 
+        _mode_cache = mode
         return mode
-    except FileNotFoundError:
-        # Registry key doesn't exist, initialize it
-        initialize_registry()
-        return '0'
+    except RegistryConfigError:
+        raise
     except Exception as e:
         raise RegistryConfigError(f"Failed to read mode from registry: {e}")
 
@@ -77,25 +162,37 @@ def set_mode(mode: Literal['0', '1']) -> None:
     Raises:
         RegistryConfigError: If mode is invalid or registry write fails
     """
+    global _mode_cache
     if mode not in ('0', '1'):
         raise RegistryConfigError(f"Invalid mode: {mode}. Must be '0' or '1'")
 
     try:
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            REGISTRY_PATH,
-            access=winreg.KEY_WRITE
-        )
+        key = _get_write_key()
         winreg.SetValueEx(key, MODE_KEY, 0, winreg.REG_SZ, mode)
-        winreg.CloseKey(key)
-    except FileNotFoundError:
-        # Registry key doesn't exist, initialize and retry
-        initialize_registry()
-        set_mode(mode)
+        _mode_cache = mode
+    except RegistryConfigError:
+        raise
     except Exception as e:
         raise RegistryConfigError(f"Failed to write mode to registry: {e}")
 
 
+def refresh_mode_cache() -> Literal['0', '1']:
+    """Drop the cached mode and re-read it from the registry.
+
+    Only needed if another process may have changed the value; normal
+    in-process reads and writes keep the cache coherent on their own.
+
+    Returns:
+        The freshly read mode value
+
+    Raises:
+        RegistryConfigError: If registry read fails or mode is invalid
+    """
+    global _mode_cache
+    _mode_cache = None
+    return get_mode()
+
+
 def toggle_mode() -> Literal['0', '1']:
     """Toggle between conversion modes.
 
@@ -6,15 +6,33 @@ for both development and PyInstaller-bundled modes.
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+from .target_config import DEFAULT_TARGETS
+
+
+# Resource root, resolved once at import: sys._MEIPASS when running as a
+# PyInstaller bundle, otherwise <project root>/resources relative to this
+# file (src/dcm_to_stl/config/settings.py).
+_BASE_PATH = (
+    Path(sys._MEIPASS) if hasattr(sys, '_MEIPASS')
+    else Path(__file__).resolve().parents[3] / 'resources'
+)
+
+
+@lru_cache(maxsize=32)
 def get_resource_path(relative_path: str) -> Path:
     """Get absolute path to resource, works for dev and PyInstaller bundled modes.
 
-    When running from source, resources are in the resources/ directory.
-    When running as PyInstaller bundle, resources are in sys._MEIPASS.
+    The base path is resolved once at import and results are memoized, so
+    repeated lookups of the same resource return the same Path object.
 
     Args:
         relative_path: Relative path from resource root (e.g., 'icons/icon.ico')
@@ -27,21 +45,20 @@ def get_resource_path(relative_path: str) -> Path:
         Path('C:/path/to/resources/icons/icon.ico')  # in dev mode
         Path('C:/Temp/_MEI.../icons/icon.ico')  # in bundled mode
     """
-    if hasattr(sys, '_MEIPASS'):
-        # Running as PyInstaller bundle
-        base_path = Path(sys._MEIPASS)
-    else:
-        # Running from source - go up to project root then to resources
-        # Current file: src/dcm_to_stl/config/settings.py
-        # Project root: ../../.. from here
-        base_path = Path(__file__).parent.parent.parent.parent / 'resources'
+    return _BASE_PATH / relative_path
+
 
-    return base_path / relative_path
+# Parsed target configs keyed by path: {path: (mtime_ns, config dict)}
+_target_config_cache: Dict[Path, tuple] = {}
 
 
 def load_target_config(config_path: Optional[str] = None) -> Dict[int, str]:
     """Load target configuration file.
 
+    The parsed config is cached per path and invalidated by file mtime,
+    so repeated conversions in one session cost a single os.stat instead
+    of re-reading and re-parsing the JSON.
+
     Args:
         config_path: Optional custom path to config file. If None, uses default location.
 
@@ -57,19 +74,36 @@ def load_target_config(config_path: Optional[str] = None) -> Dict[int, str]:
     else:
         config_path = Path(config_path)
 
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    mtime = os.stat(config_path).st_mtime_ns
+    cached = _target_config_cache.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    # One buffered binary read; orjson parses bytes directly when available
+    with open(config_path, 'rb') as f:
+        data = f.read()
+    config = orjson.loads(data) if orjson is not None else json.loads(data)
+
+    _target_config_cache[config_path] = (mtime, config)
+    return config
 
 
 def get_target_filenames(config_path: Optional[str] = None) -> list[str]:
     """Get list of target DCM filenames from configuration.
 
+    A target_config.ini on disk takes precedence so deployments can still
+    customize the list; when the default file is absent, the built-in
+    DEFAULT_TARGETS tuple is returned with no file I/O or parse at all.
+
     Args:
         config_path: Optional custom path to config file
 
     Returns:
         List of target DCM filenames (e.g., ['PrePreparationScan.dcm', ...])
     """
+    if config_path is None and not get_resource_path('config/target_config.ini').exists():
+        return list(DEFAULT_TARGETS)
+
     config = load_target_config(config_path)
     return list(config.values())
 
@@ -7,6 +7,23 @@ import json
 from pathlib import Path
 
 
+# Built-in target list, known at build time. Runtime callers use this
+# directly when no target_config.ini is present, skipping the file read
+# and JSON parse entirely.
+DEFAULT_TARGETS = (
+    "PrePreparationScan.dcm",
+    "Raw Preparation scan.dcm",
+    "PreparationScan.dcm",
+    "AntagonistScan.dcm",
+    "Raw Antagonist scan.dcm",
+    "AbutmentAlignmentScan.dcm",
+    "Raw Bite scan.dcm",
+    "Raw Bite scan2.dcm",
+)
+
+TARGET_SET = frozenset(DEFAULT_TARGETS)
+
+
 def generate_target_config(output_path: str = None) -> dict:
     """Generate the default target configuration.
 
@@ -17,14 +34,8 @@ def generate_target_config(output_path: str = None) -> dict:
         Dictionary mapping numbers to target DCM filenames.
     """
     config = {
-        1: "PrePreparationScan.dcm",
-        2: "Raw Preparation scan.dcm",
-        3: "PreparationScan.dcm",
-        4: "AntagonistScan.dcm",
-        5: "Raw Antagonist scan.dcm",
-        6: "AbutmentAlignmentScan.dcm",
-        7: "Raw Bite scan.dcm",
-        8: "Raw Bite scan2.dcm"
+        number: filename
+        for number, filename in enumerate(DEFAULT_TARGETS, start=1)
     }
 
     if output_path:
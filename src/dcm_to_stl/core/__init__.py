@@ -2,8 +2,9 @@
 from .converter import DCMConverter, ConversionMode, convert_directory_simple
 from .sdx_interface import SDXInterface, SDXError
 from .file_utils import (
-    list_files,
-    identify_dcm,
+    iter_dcm_files,
+    iter_named_files,
+    scan_dcm_files_parallel,
     get_stl_output_path,
     filter_target_files
 )
@@ -14,8 +15,9 @@ __all__ = [
     'convert_directory_simple',
     'SDXInterface',
     'SDXError',
-    'list_files',
-    'identify_dcm',
+    'iter_dcm_files',
+    'iter_named_files',
+    'scan_dcm_files_parallel',
     'get_stl_output_path',
     'filter_target_files',
 ]
@@ -4,10 +4,19 @@ This module consolidates the conversion logic previously duplicated
 between gui.py and main.py.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
 from typing import Optional, Callable, List
+
+import pythoncom
+
 from .sdx_interface import SDXInterface, SDXError
-from .file_utils import list_files, identify_dcm, get_stl_output_path, filter_target_files
+from .file_utils import (
+    iter_dcm_files,
+    iter_named_files,
+    scan_dcm_files_parallel,
+    get_stl_output_path
+)
 
 
 class ConversionMode(Enum):
@@ -31,20 +40,29 @@ class DCMConverter:
     def __init__(self,
                  mode: str = '0',
                  target_filenames: Optional[List[str]] = None,
-                 progress_callback: Optional[Callable[[str], None]] = None):
+                 progress_callback: Optional[Callable[[str], None]] = None,
+                 max_workers: int = 1):
         """Initialize converter.
 
         Args:
             mode: Conversion mode ('0' = all, '1' = targets only)
             target_filenames: List of target filenames for mode '1'
             progress_callback: Optional callback function for progress updates
+            max_workers: Number of parallel SDX worker threads (default 1,
+                i.e. sequential conversion through a single connection)
         """
         if mode not in ('0', '1'):
             raise ValueError(f"Invalid mode: {mode}. Must be '0' or '1'")
 
+        if max_workers < 1:
+            raise ValueError(f"Invalid max_workers: {max_workers}. Must be >= 1")
+
         self.mode = mode
         self.target_filenames = target_filenames or []
+        # Frozenset of basenames for O(1) membership tests in the filter loop
+        self._target_basenames = frozenset(self.target_filenames)
         self.progress_callback = progress_callback
+        self.max_workers = max_workers
 
     def _report_progress(self, message: str) -> None:
         """Report progress to callback if available.
@@ -70,17 +88,28 @@ class DCMConverter:
         if not os.path.exists(directory):
             raise ValueError(f"Directory does not exist: {directory}")
 
-        # Find all DCM files
-        all_dcm_files = []
-        for filepath in list_files(directory):
-            if identify_dcm(filepath):
-                all_dcm_files.append(filepath)
+        # Normalize once so every discovered path is already absolute
+        directory = os.path.abspath(directory)
+
+        # A multi-worker converter also gets a multi-worker walk, which
+        # hides per-directory latency on network shares
+        if self.max_workers > 1:
+            names = (self._target_basenames
+                     if self.mode == ConversionMode.TARGET_ONLY.value
+                     else None)
+            if self.mode in (ConversionMode.ALL_FILES.value,
+                             ConversionMode.TARGET_ONLY.value):
+                return scan_dcm_files_parallel(
+                    directory, names=names, max_workers=self.max_workers)
+            raise ValueError(f"Invalid mode: {self.mode}")
 
-        # Filter based on mode
+        # Branch on mode once, outside the per-file loop
         if self.mode == ConversionMode.ALL_FILES.value:
-            return all_dcm_files
+            return list(iter_dcm_files(directory))
         elif self.mode == ConversionMode.TARGET_ONLY.value:
-            return filter_target_files(all_dcm_files, self.target_filenames)
+            # Match directory-entry names against the target set directly;
+            # no basename extraction per file
+            return list(iter_named_files(directory, self._target_basenames))
         else:
             raise ValueError(f"Invalid mode: {self.mode}")
 
@@ -92,19 +121,20 @@ class DCMConverter:
             sdx: Attached SDX interface
 
         Raises:
-            ValueError: If input file is invalid
-            SDXError: If conversion fails
+            SDXError: If conversion fails or the input file is invalid
         """
-        if not os.path.isfile(input_file):
-            raise ValueError(f"Input file does not exist: {input_file}")
-
-        # Generate output path
+        # Discovered paths are already absolute (discover_files normalizes
+        # the root), so this is a pure string check with no syscall; a
+        # missing file surfaces as an SDX error rather than an extra stat
+        # per conversion.
+        if not os.path.isabs(input_file):
+            input_file = os.path.abspath(input_file)
         output_file = get_stl_output_path(input_file)
 
         # Convert using SDX
         sdx.convert_file(
-            input_file=os.path.abspath(input_file),
-            output_file=os.path.abspath(output_file),
+            input_file=input_file,
+            output_file=output_file,
             progress_callback=self.progress_callback
         )
 
@@ -130,41 +160,144 @@ class DCMConverter:
             self._report_progress("No DCM files found")
             return 0
 
-        self._report_progress(f"Found {len(conversion_list)} DCM file(s) to convert")
+        total = len(conversion_list)
+        self._report_progress(f"Found {total} DCM file(s) to convert")
+
+        # Parallel path: each worker thread owns its own SDX connection
+        if self.max_workers > 1 and total > 1:
+            return self._convert_parallel(conversion_list)
 
         # Use provided SDX or create temporary one
-        converted_count = 0
         if sdx_interface and sdx_interface.is_attached:
             # Use existing attached SDX connection
-            for input_file in conversion_list:
-                try:
-                    self.convert_file(input_file, sdx_interface)
-                    converted_count += 1
-                    self._report_progress(f"Converted {converted_count}/{len(conversion_list)}")
-                except Exception as e:
-                    self._report_progress(f"Error converting {input_file}: {e}")
-                    # Continue with next file instead of aborting
+            converted_count = self._convert_sequential(
+                conversion_list, sdx_interface)
         else:
             # Create temporary SDX connection (legacy behavior)
             with SDXInterface() as sdx:
                 self._report_progress("Connected to SDX")
+                converted_count = self._convert_sequential(conversion_list, sdx)
+
+        self._report_progress(f"Conversion complete: {converted_count}/{total} files")
+        return converted_count
 
-                for input_file in conversion_list:
-                    try:
-                        self.convert_file(input_file, sdx)
-                        converted_count += 1
-                        self._report_progress(f"Converted {converted_count}/{len(conversion_list)}")
-                    except Exception as e:
-                        self._report_progress(f"Error converting {input_file}: {e}")
-                        # Continue with next file instead of aborting
+    def _safe_convert(self, input_file: str, sdx: SDXInterface) -> Optional[str]:
+        """Convert one file, trapping any failure.
 
-        self._report_progress(f"Conversion complete: {converted_count}/{len(conversion_list)} files")
+        Keeps the exception handler out of the callers' loop bodies; a
+        failure is returned as a message instead of raised so the batch
+        continues.
+
+        Args:
+            input_file: Path to input DCM file
+            sdx: Attached SDX interface
+
+        Returns:
+            None on success, otherwise a formatted error message
+        """
+        try:
+            self.convert_file(input_file, sdx)
+            return None
+        except Exception as e:
+            return f"Error converting {input_file}: {e}"
+
+    def _convert_sequential(self, conversion_list: List[str], sdx: SDXInterface) -> int:
+        """Convert files one at a time through a single SDX connection.
+
+        Per-file progress is only emitted when the completed percentage
+        crosses an integer boundary, so huge batches don't flood the
+        callback with thousands of near-identical strings. Errors are
+        collected and reported together after the loop.
+
+        Args:
+            conversion_list: File paths to convert
+            sdx: Attached SDX interface
+
+        Returns:
+            Number of files successfully converted
+        """
+        total = len(conversion_list)
+        converted_count = 0
+        last_pct = -1
+        errors = []
+        for input_file in conversion_list:
+            error = self._safe_convert(input_file, sdx)
+            if error is None:
+                converted_count += 1
+                pct = converted_count * 100 // total
+                if pct != last_pct:
+                    last_pct = pct
+                    self._report_progress(f"Converted {converted_count}/{total}")
+            else:
+                errors.append(error)
+
+        for error in errors:
+            self._report_progress(error)
         return converted_count
 
+    def _convert_batch(self, batch: List[str], total: int, converted: List[str]) -> None:
+        """Convert a batch of files on a worker thread with its own SDX.
+
+        Each worker initializes COM for its thread, attaches one persistent
+        SDX connection, converts its whole batch through it, then detaches.
+
+        Args:
+            batch: File paths assigned to this worker
+            total: Total number of files across all workers (for progress)
+            converted: Shared list collecting successfully converted paths
+                (list.append is atomic, so no extra locking is needed)
+        """
+        pythoncom.CoInitialize()
+        try:
+            with SDXInterface() as sdx:
+                errors = []
+                for input_file in batch:
+                    error = self._safe_convert(input_file, sdx)
+                    if error is None:
+                        converted.append(input_file)
+                        self._report_progress(f"Converted {len(converted)}/{total}")
+                    else:
+                        errors.append(error)
+                for error in errors:
+                    self._report_progress(error)
+        finally:
+            pythoncom.CoUninitialize()
+
+    def _convert_parallel(self, conversion_list: List[str]) -> int:
+        """Convert files in parallel across multiple SDX worker threads.
+
+        Args:
+            conversion_list: All file paths to convert
+
+        Returns:
+            Number of files successfully converted
+        """
+        workers = min(self.max_workers, len(conversion_list))
+        converted: List[str] = []
+        total = len(conversion_list)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Round-robin split so each worker attaches exactly once
+            futures = [
+                executor.submit(self._convert_batch,
+                                conversion_list[i::workers], total, converted)
+                for i in range(workers)
+            ]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    # Typically an attach failure; that worker's batch is lost
+                    self._report_progress(f"Worker error: {e}")
+
+        self._report_progress(f"Conversion complete: {len(converted)}/{total} files")
+        return len(converted)
+
 
 def convert_directory_simple(directory: str,
                              mode: str = '0',
-                             target_filenames: Optional[List[str]] = None) -> int:
+                             target_filenames: Optional[List[str]] = None,
+                             max_workers: int = 1) -> int:
     """Simple function interface for directory conversion.
 
     Convenience function for one-off conversions without creating a converter object.
@@ -173,9 +306,12 @@ def convert_directory_simple(directory: str,
         directory: Directory to search and convert
         mode: Conversion mode ('0' = all, '1' = targets only)
         target_filenames: List of target filenames for mode '1'
+        max_workers: Number of parallel SDX worker threads
 
     Returns:
         Number of files successfully converted
     """
-    converter = DCMConverter(mode=mode, target_filenames=target_filenames)
+    converter = DCMConverter(mode=mode,
+                             target_filenames=target_filenames,
+                             max_workers=max_workers)
     return converter.convert_directory(directory)
@@ -1,35 +1,122 @@
 """File utility functions for DCM file discovery and processing."""
 import os
-from pathlib import Path
-from typing import Generator, Optional
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Generator, List, Optional
 
 
-def list_files(directory: str) -> Generator[str, None, None]:
-    """Recursively walk directory and yield all file paths.
+def iter_dcm_files(directory: str) -> Generator[str, None, None]:
+    """Recursively scan directory and yield DCM file paths.
+
+    Uses os.scandir directly so each entry's type comes from the directory
+    read itself (no extra stat per file) and the extension check is a
+    single lowercase suffix comparison. Unreadable directories are
+    skipped, matching os.walk's default behavior (locked system folders
+    at drive roots or restricted SMB shares must not abort discovery).
 
     Args:
-        directory: Root directory to walk
+        directory: Root directory to scan
 
     Yields:
-        Absolute file paths
+        Paths of files with a '.dcm' extension (case-insensitive)
     """
-    for root, directories, files in os.walk(directory):
-        for filename in files:
-            yield os.path.join(root, filename)
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return  # Skip directories we can't read
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_dcm_files(entry.path)
+            elif entry.name[-4:].lower() == '.dcm':
+                yield entry.path
+
+
+def iter_named_files(directory: str, names) -> Generator[str, None, None]:
+    """Recursively scan directory and yield files with matching names.
+
+    Like iter_dcm_files, but tests the DirEntry name against a set of
+    exact filenames instead of an extension, so selective mode needs no
+    os.path.basename call per file. Unreadable directories are skipped.
 
+    Args:
+        directory: Root directory to scan
+        names: Container of filenames to match (ideally a set/frozenset)
+
+    Yields:
+        Paths of files whose name is in names
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return  # Skip directories we can't read
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_named_files(entry.path, names)
+            elif entry.name in names:
+                yield entry.path
 
-def identify_dcm(path: str) -> Optional[str]:
-    """Check if file is a DCM file by extension.
+
+def _scan_one_dir(directory: str, names) -> tuple:
+    """Scan a single directory level for subdirectories and matching files.
+
+    Args:
+        directory: Directory to scan (one level, no recursion)
+        names: Set of exact filenames to match, or None to match any
+            '.dcm' extension
+
+    Unreadable directories yield empty results instead of raising, so a
+    single locked folder can't abort the whole scan.
+
+    Returns:
+        (subdirectory paths, matching file paths) tuple
+    """
+    subdirs = []
+    matches = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif (entry.name in names if names is not None
+                      else entry.name[-4:].lower() == '.dcm'):
+                    matches.append(entry.path)
+    except OSError:
+        pass  # Skip directories we can't read
+    return subdirs, matches
+
+
+def scan_dcm_files_parallel(directory: str,
+                            names=None,
+                            max_workers: int = 8) -> List[str]:
+    """Discover DCM files using several threads to scan directories.
+
+    Directory listing on SMB shares and spinning disks is latency-bound,
+    so independent subdirectories are scanned concurrently: each worker
+    reads one directory level and feeds any subdirectories back into the
+    pool. Result order is not guaranteed.
 
     Args:
-        path: File path to check
+        directory: Root directory to scan
+        names: Optional set of exact filenames to match; None matches any
+            '.dcm' extension
+        max_workers: Concurrent directory reads (capped at 8, the typical
+            Windows SMB client request limit)
 
     Returns:
-        The filepath if extension is '.dcm' (case-insensitive), otherwise None
+        List of matching file paths
     """
-    if os.path.splitext(path)[1].lower() == '.dcm':
-        return path
-    return None
+    results: List[str] = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, 8)) as executor:
+        pending = {executor.submit(_scan_one_dir, directory, names)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirs, matches = future.result()
+                results.extend(matches)
+                for subdir in subdirs:
+                    pending.add(executor.submit(_scan_one_dir, subdir, names))
+    return results
 
 
 def get_stl_output_path(dcm_input_path: str) -> str:
@@ -65,7 +152,8 @@ def filter_target_files(file_list: list[str], target_filenames: list[str]) -> li
         >>> filter_target_files(files, targets)
         ['/a/b/foo.dcm']
     """
+    targets = frozenset(target_filenames)
     return [
         filepath for filepath in file_list
-        if os.path.basename(filepath) in target_filenames
+        if os.path.basename(filepath) in targets
     ]
@@ -6,7 +6,7 @@ consolidating error handling and connection management.
 import time
 from typing import Optional, Callable
 import win32com.client as win32
-from win32com.client import Dispatch
+from win32com.client import Dispatch, gencache
 
 
 class SDXError(Exception):
@@ -14,6 +14,28 @@ class SDXError(Exception):
     pass
 
 
+# Module-level table of SDX Execute() error codes, indexed by state
+# (index 0 is success and never formatted; -1 is special-cased)
+_CATASTROPHE_MESSAGE = "The whole world has gone bonkers"
+_COM_ERROR_MESSAGES = (
+    "",
+    "No input file specified",
+    "No output file specified",
+    "No output format specified",
+    "Powershape/Camtek option passed but no voucher given",
+    "Can't translate from the input format",
+    "Can't translate to the output format",
+    "The calling client is not attached",
+    "Extract CATIA requested but input file is not CATIA",
+    "Extract CATIA requested, input file is CATIA but extraction failed",
+    "Decrypt proe requested but input file is not proe",
+    "Decrypt proe requested, input file is proe but decryption failed",
+    "The passed voucher is invalid for the given input file",
+    "No PAF/Flex/Voucher exists for the input file",
+    "Input file is the same as the output file"
+)
+
+
 class SDXInterface:
     """Wrapper for the Delcam SDX COM interface.
 
@@ -27,6 +49,8 @@ class SDXInterface:
 
     def __init__(self):
         self._sdx: Optional[Dispatch] = None
+        # Last (input_format, output_format) sent to SDX on this connection
+        self._formats: Optional[tuple] = None
 
     def attach(self) -> Dispatch:
         """Initialize and attach to the SDX COM interface.
@@ -38,7 +62,14 @@ class SDXInterface:
             SDXError: If connection fails.
         """
         try:
-            self._sdx = win32.Dispatch("sdx.DelcamExchange")
+            # Prefer early binding: the generated typelib wrapper caches
+            # DISPIDs, avoiding a GetIDsOfNames round-trip for every
+            # SetOption/Execute/Finished access
+            try:
+                self._sdx = gencache.EnsureDispatch("sdx.DelcamExchange")
+            except Exception:
+                # No registered type library; fall back to late binding
+                self._sdx = win32.Dispatch("sdx.DelcamExchange")
             self._sdx.Attach()
             return self._sdx
         except Exception as e:
@@ -53,6 +84,7 @@ class SDXInterface:
                 pass  # Ignore errors during detach
             finally:
                 self._sdx = None
+                self._formats = None
 
     @property
     def is_attached(self) -> bool:
@@ -87,6 +119,26 @@ class SDXInterface:
             raise SDXError("Not attached to SDX. Call attach() first.")
         return self._sdx
 
+    def set_formats(self, input_format: str, output_format: str) -> None:
+        """Send format options to SDX and remember them for this connection.
+
+        Useful for heterogeneous batches: callers can reconfigure formats
+        explicitly instead of relying on the per-convert_file memo.
+
+        Args:
+            input_format: Input format name (e.g. "3Shape")
+            output_format: Output format name (e.g. "STL")
+
+        Raises:
+            SDXError: If not attached
+        """
+        if self._sdx is None:
+            raise SDXError("Not attached to SDX. Call attach() first.")
+
+        self._sdx.SetOption("INPUT_FORMAT", input_format)
+        self._sdx.SetOption("OUTPUT_FORMAT", output_format)
+        self._formats = (input_format, output_format)
+
     def convert_file(self,
                     input_file: str,
                     output_file: str,
@@ -108,21 +160,36 @@ class SDXInterface:
         if self._sdx is None:
             raise SDXError("Not attached to SDX. Call attach() first.")
 
-        # Configure SDX
-        self._sdx.SetOption("INPUT_FORMAT", input_format)
-        self._sdx.SetOption("OUTPUT_FORMAT", output_format)
-        self._sdx.SetOption("INPUT_FILE", input_file)
-        self._sdx.SetOption("OUTPUT_FILE", output_file)
+        # Configure SDX; the formats are invariant across a batch, so only
+        # re-send them when they actually change on this connection. Bind
+        # SetOption once to skip the dispatch-layer attribute lookup per call.
+        setopt = self._sdx.SetOption
+        if self._formats != (input_format, output_format):
+            setopt("INPUT_FORMAT", input_format)
+            setopt("OUTPUT_FORMAT", output_format)
+            self._formats = (input_format, output_format)
+        setopt("INPUT_FILE", input_file)
+        setopt("OUTPUT_FILE", output_file)
 
         # Execute conversion
         state = self._sdx.Execute()
 
         if state == 0:
-            # Wait for conversion to complete
+            # Wait for conversion to complete with exponential backoff:
+            # most conversions finish well under a second, so start with a
+            # short sleep and back off instead of polling once per second.
+            # Progress ticks are throttled so the fast early polls don't
+            # flood the callback.
+            delay = 0.01
+            last_emit = 0.0
             while not self._sdx.Finished:
                 if progress_callback:
-                    progress_callback("converting...")
-                time.sleep(1)
+                    now = time.monotonic()
+                    if now - last_emit >= 0.25:
+                        progress_callback("converting...")
+                        last_emit = now
+                time.sleep(delay)
+                delay = min(delay * 1.5, 0.25)
 
             if progress_callback:
                 progress_callback(f"Converted: {input_file}")
@@ -140,23 +207,10 @@ class SDXInterface:
         Returns:
             Error message string
         """
-        error_messages = {
-            -1: "The whole world has gone bonkers",
-            1: "No input file specified",
-            2: "No output file specified",
-            3: "No output format specified",
-            4: "Powershape/Camtek option passed but no voucher given",
-            5: "Can't translate from the input format",
-            6: "Can't translate to the output format",
-            7: "The calling client is not attached",
-            8: "Extract CATIA requested but input file is not CATIA",
-            9: "Extract CATIA requested, input file is CATIA but extraction failed",
-            10: "Decrypt proe requested but input file is not proe",
-            11: "Decrypt proe requested, input file is proe but decryption failed",
-            12: "The passed voucher is invalid for the given input file",
-            13: "No PAF/Flex/Voucher exists for the input file",
-            14: "Input file is the same as the output file"
-        }
-
-        msg = error_messages.get(state, f"Unknown error code: {state}")
+        if state == -1:
+            msg = _CATASTROPHE_MESSAGE
+        elif 0 < state < len(_COM_ERROR_MESSAGES):
+            msg = _COM_ERROR_MESSAGES[state]
+        else:
+            msg = f"Unknown error code: {state}"
         return f"COM Error {state}: {msg}"
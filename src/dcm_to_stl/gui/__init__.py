@@ -1,10 +1,7 @@
 """GUI application."""
 from .app import App, main
-from .events import Ticket, TicketPurpose
 
 __all__ = [
     'App',
     'main',
-    'Ticket',
-    'TicketPurpose',
 ]
@@ -8,7 +8,7 @@ import ctypes
 import os
 import sys
 import threading
-from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
 from tkinter.filedialog import askdirectory
 
 import customtkinter as ctk
@@ -19,7 +19,6 @@ from ..core.converter import DCMConverter
 from ..core.sdx_interface import SDXInterface
 from ..config.registry import get_mode, toggle_mode, RegistryConfigError
 from ..config.settings import get_target_filenames, get_icon_path
-from .events import Ticket, TicketPurpose
 
 
 # Configure CustomTkinter appearance
@@ -28,41 +27,51 @@ ctk.set_appearance_mode("dark")
 
 
 class ToolTip:
-    """Simple tooltip for CustomTkinter widgets."""
+    """Simple tooltip for CustomTkinter widgets.
 
-    def __init__(self, widget):
-        self.widget = widget
-        self.tip_window = None
-        self.text = ""
+    The tooltip window is created once and hidden with withdraw()/shown
+    with deiconify(), avoiding a full Toplevel + Label construction on
+    every mouse-enter.
+    """
 
-    def show(self, text: str):
-        """Show tooltip with given text."""
-        self.text = text
-        if self.tip_window or not self.text:
-            return
+    __slots__ = ('widget', 'visible', 'tip_window', 'label')
 
-        x = self.widget.winfo_rootx() + 20
-        y = self.widget.winfo_rooty() + 20
+    def __init__(self, widget):
+        self.widget = widget
+        self.visible = False
 
-        self.tip_window = tw = ctk.CTkToplevel(self.widget)
+        self.tip_window = tw = ctk.CTkToplevel(widget)
         tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
+        tw.withdraw()
 
-        label = ctk.CTkLabel(
+        self.label = ctk.CTkLabel(
             tw,
-            text=self.text,
+            text="",
             fg_color=("gray75", "gray25"),
             corner_radius=6,
             padx=8,
             pady=4
         )
-        label.pack()
+        self.label.pack()
+
+    def show(self, text: str):
+        """Show tooltip with given text."""
+        if self.visible or not text:
+            return
+
+        x = self.widget.winfo_rootx() + 20
+        y = self.widget.winfo_rooty() + 20
+
+        self.label.configure(text=text)
+        self.tip_window.wm_geometry(f"+{x}+{y}")
+        self.tip_window.deiconify()
+        self.visible = True
 
     def hide(self):
         """Hide tooltip."""
-        if self.tip_window:
-            self.tip_window.destroy()
-            self.tip_window = None
+        if self.visible:
+            self.tip_window.withdraw()
+            self.visible = False
 
 # Set Windows AppUserModelID for taskbar icon
 myappid = "Creo.DCM.to.STL.Autoconverter.1.0"
@@ -113,14 +122,25 @@ class App(ctk.CTk):
         self.sdx_status.bind("<Enter>", self._on_status_enter)
         self.sdx_status.bind("<Leave>", self._on_status_leave)
 
-        self.queue_message = Queue()
-        self.bind("<<CheckQueue>>", self.handle_progress_event)
+        # Latest-wins progress slot; bursts of updates coalesce into one
+        # scheduled UI callback instead of flooding the Tk event queue
+        self._progress_lock = threading.Lock()
+        self._progress_text = ""
+        self._progress_scheduled = False
 
         # Initialize SDX interface (but don't attach yet)
         self.sdx = SDXInterface()
         # Register cleanup on exit
         atexit.register(self.sdx.detach)
 
+        # Single-worker pool for conversions: one long-lived thread, and
+        # repeated clicks can't start concurrent jobs against one SDX
+        self._converter_pool = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='converter'
+        )
+        atexit.register(self._converter_pool.shutdown, wait=False)
+
         # Schedule SDX attachment after GUI appears (non-blocking)
         self.after(100, self._attach_sdx_background)
 
@@ -176,15 +196,24 @@ class App(ctk.CTk):
     def button1_event(self) -> None:
         """Handle Select Folder button click.
 
-        Starts conversion process in background thread.
+        Submits the conversion to the single-worker pool and disables the
+        button until the job completes.
         """
         self.generate_progress_event('Starting...')
-        thread = threading.Thread(
-            target=self.main,
-            name='converter',
-            daemon=False
+        self.button1.configure(state='disabled')
+        future = self._converter_pool.submit(self._run_main)
+        future.add_done_callback(
+            lambda f: self.after(
+                0, lambda: self.button1.configure(state='normal'))
         )
-        thread.start()
+
+    def _run_main(self) -> None:
+        """Run the conversion logic with COM initialized for this thread."""
+        pythoncom.CoInitialize()
+        try:
+            self.main()
+        finally:
+            pythoncom.CoUninitialize()
 
     def button2_event(self) -> None:
         """Handle Toggle Mode button click.
@@ -206,30 +235,30 @@ class App(ctk.CTk):
         except (RegistryConfigError, ValueError) as e:
             self.generate_progress_event(f"Error: {e}")
 
-    def handle_progress_event(self, event) -> None:
-        """Handle progress update events from converter thread.
-
-        Args:
-            event: Tkinter event (unused but required by event handler signature)
-        """
-        msg: Ticket = self.queue_message.get()
-
-        if msg.ticket_type == TicketPurpose.UPDATE_PROGRESS:
-            self.info_field.configure(text=msg.ticket_value)
-
     def generate_progress_event(self, text: str) -> None:
-        """Generate a progress update event for the UI.
+        """Schedule a progress update on the UI thread.
+
+        Thread-safe: after() hands the callback to the Tk event loop, so
+        this can be called directly from the converter thread. Rapid
+        updates coalesce — only the newest message is shown, and at most
+        one callback is pending at a time.
 
         Args:
             text: Progress message to display
         """
-        ticket = Ticket(
-            ticket_type=TicketPurpose.UPDATE_PROGRESS,
-            ticket_value=f"{text}"
-        )
-
-        self.queue_message.put(ticket)
-        self.event_generate("<<CheckQueue>>")
+        with self._progress_lock:
+            self._progress_text = text
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
+        self.after(0, self._apply_progress)
+
+    def _apply_progress(self) -> None:
+        """Apply the most recent progress message (runs on the UI thread)."""
+        with self._progress_lock:
+            text = self._progress_text
+            self._progress_scheduled = False
+        self.info_field.configure(text=text)
 
     def _update_sdx_status(self, color: str) -> None:
         """Update the SDX status indicator color.